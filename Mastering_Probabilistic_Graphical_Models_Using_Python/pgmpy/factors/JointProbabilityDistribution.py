@@ -115,7 +115,7 @@ class JointProbabilityDistribution(Factor):
             x1_1    x2_1    0.108469538521
             x1_1    x2_2    0.275541180284
         """
-        return self.marginalize(list(set(list(self.variables)) -
+        return self.marginalize(list(set(self.variables) -
                                      set(variables if isinstance(
                                          variables, (list, set, dict, tuple)) else [variables])),
                                 inplace=inplace)
@@ -9,6 +9,11 @@ from pgmpy.base import DirectedGraph, UndirectedGraph
 
 
 class DynamicBayesianNetwork(DirectedGraph):
+
+    __slots__ = ('cpds', 'cardinalities', '_ancestors',
+                 '_intra0', '_intra1', '_inter', '_names', '_cpd_index',
+                 '_version', '_undirected_cache')
+
     def __init__(self, ebunch=None):
         """
         Base class for Dynamic Bayesian Network
@@ -59,9 +64,17 @@ class DynamicBayesianNetwork(DirectedGraph):
         intra_slice
         """
         super().__init__()
+        self._ancestors = defaultdict(set)
+        self._names = set()
+        self._intra0 = []
+        self._intra1 = []
+        self._inter = []
+        self._version = 0
+        self._undirected_cache = (None, -1)
         if ebunch:
             self.add_edges_from(ebunch)
         self.cpds = []
+        self._cpd_index = {}
         self.cardinalities = defaultdict(int)
 
     def add_node(self, node, **attr):
@@ -79,6 +92,9 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn = DBN()
         >>> dbn.add_node('A')
         """
+        self._names.add(node)
+        if (node, 0) in self.node and not attr:
+            return
         super().add_node((node, 0), **attr)
 
     def add_nodes_from(self, nodes, **attr):
@@ -96,8 +112,13 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn = DBN()
         >>> dbn.add_nodes_from(['A', 'B', 'C'])
         """
+        names = self._names
+        nodes_dict = self.node
+        add_node = super().add_node
         for node in nodes:
-            self.add_node(node)
+            names.add(node)
+            if (node, 0) not in nodes_dict:
+                add_node((node, 0))
 
     def nodes(self):
         """
@@ -111,13 +132,12 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn.nodes()
         ['B', 'A', 'C']
         """
-        return list(set([node for node, timeslice in super().nodes()]))
+        return list(self._names)
 
-    def add_edge(self, start, end, **kwargs):
+    def _validate_edge(self, start, end):
         """
-        Add an edge between two nodes.
-
-        The nodes will be automatically added if they are not present in the network.
+        Validates the edge between start and end and returns the
+        normalized (start, end) pair without modifying the network.
 
         Parameters
         ----------
@@ -125,15 +145,6 @@ class DynamicBayesianNetwork(DirectedGraph):
                     Here, node_name can be a hashable python object while the
                     time_slice is an integer value, which denotes the index of the
                     time_slice that the node belongs to.
-
-        Examples
-        --------
-        >>> from pgmpy.models import DynamicBayesianNetwork as DBN
-        >>> model = DBN()
-        >>> model.add_nodes_from(['D', 'I'])
-        >>> model.add_edge(('D',0), ('I',0))
-        >>> model.edges()
-        [(('D', 1), ('G', 1)), (('D', 0), ('G', 0))]
         """
         try:
             if len(start) != 2 or len(end) !=2:
@@ -155,14 +166,77 @@ class DynamicBayesianNetwork(DirectedGraph):
 
         if start == end:
             raise ValueError('Self Loops are not allowed')
-        elif start in super().nodes() and end in super().nodes() and nx.has_path(self, end, start):
+
+        return start, end
+
+    def _update_ancestors(self, start, end):
+        """
+        Propagates the ancestors of start to end and to every descendant
+        of end after the edge (start, end) has been inserted.
+        """
+        queue = [(end, self._ancestors[start] | {start})]
+        while queue:
+            node, new_ancestors = queue.pop()
+            ancestors = self._ancestors[node]
+            if not new_ancestors <= ancestors:
+                ancestors |= new_ancestors
+                for successor in self.successors_iter(node):
+                    queue.append((successor, ancestors | {node}))
+
+    def _record_edge(self, start, end):
+        """
+        Updates the node-name set, the per-slice edge buckets and the
+        ancestor sets for a newly inserted (start, end) edge.
+        """
+        self._names.add(start[0])
+        self._names.add(end[0])
+        self._version += 1
+        if start[1] == end[1]:
+            bucket = self._intra0 if start[1] == 0 else self._intra1
+            bucket.append((start, end))
+        else:
+            self._inter.append((start, end))
+        self._update_ancestors(start, end)
+
+    def add_edge(self, start, end, **kwargs):
+        """
+        Add an edge between two nodes.
+
+        The nodes will be automatically added if they are not present in the network.
+
+        Parameters
+        ----------
+        start, end: The start, end nodes should contain the (node_name, time_slice)
+                    Here, node_name can be a hashable python object while the
+                    time_slice is an integer value, which denotes the index of the
+                    time_slice that the node belongs to.
+
+        Examples
+        --------
+        >>> from pgmpy.models import DynamicBayesianNetwork as DBN
+        >>> model = DBN()
+        >>> model.add_nodes_from(['D', 'I'])
+        >>> model.add_edge(('D',0), ('I',0))
+        >>> model.edges()
+        [(('D', 1), ('G', 1)), (('D', 0), ('G', 0))]
+        """
+        start, end = self._validate_edge(start, end)
+
+        if end in self._ancestors[start]:
             raise ValueError(
                  'Loops are not allowed. Adding the edge from (%s->%s) forms a loop.' % (str(end), str(start)))
 
+        is_new = not self.has_edge(start, end)
         super().add_edge(start, end, **kwargs)
+        if is_new:
+            self._record_edge(start, end)
 
         if start[1] == end[1]:
-            super().add_edge((start[0], 1 - start[1]), (end[0], 1 - end[1]))
+            mirror_start = (start[0], 1 - start[1])
+            mirror_end = (end[0], 1 - end[1])
+            if not self.has_edge(mirror_start, mirror_end):
+                super().add_edge(mirror_start, mirror_end)
+                self._record_edge(mirror_start, mirror_end)
 
     def add_edges_from(self, ebunch, **kwargs):
         """
@@ -180,8 +254,29 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn = DBN()
         >>> dbn.add_edges_from([(('D',0), ('G',0)), (('I',0), ('G',0))])
         """
-        for edge in ebunch:
-            self.add_edge(edge[0], edge[1])
+        normalized = [self._validate_edge(edge[0], edge[1]) for edge in ebunch]
+        mirrors = [((start[0], 1 - start[1]), (end[0], 1 - end[1]))
+                   for start, end in normalized if start[1] == end[1]]
+
+        new_edges = []
+        seen = set()
+        for edge in normalized + mirrors:
+            if edge not in seen and not self.has_edge(*edge):
+                seen.add(edge)
+                new_edges.append(edge)
+
+        new_nodes = {node for edge in new_edges for node in edge
+                     if node not in self.node}
+
+        nx.DiGraph.add_edges_from(self, normalized + mirrors)
+
+        if not nx.is_directed_acyclic_graph(self):
+            super().remove_edges_from(new_edges)
+            super().remove_nodes_from(new_nodes)
+            raise ValueError('Loops are not allowed. Adding the given edges forms a loop.')
+
+        for start, end in new_edges:
+            self._record_edge(start, end)
 
     def get_intra_edges(self, time_slice=0):
         """
@@ -203,7 +298,8 @@ class DynamicBayesianNetwork(DirectedGraph):
         if not isinstance(time_slice, int) or time_slice < 0:
             raise ValueError("The timeslice should be a positive value greater than or equal to zero")
 
-        return [tuple((x[0], time_slice) for x in edge) for edge in self.edges() if edge[0][1] == edge[1][1] == 0]
+        return [((start[0], time_slice), (end[0], time_slice))
+                for start, end in self._intra0]
 
     def get_inter_edges(self):
         """
@@ -217,7 +313,7 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn.get_inter_edges()
         [(('D', 0), ('D', 1)), (('I', 0), ('I', 1))]
         """
-        return [edge for edge in self.edges() if edge[0][1] != edge[1][1]]
+        return list(self._inter)
 
     def get_interface_nodes(self, time_slice=0):
     	"""
@@ -239,7 +335,7 @@ class DynamicBayesianNetwork(DirectedGraph):
     	if not isinstance(time_slice, int) or time_slice < 0:
             raise ValueError("The timeslice should be a positive value greater than or equal to zero")
 
-    	return [(edge[0][0], time_slice) for edge in self.get_inter_edges()]
+    	return [(edge[0][0], time_slice) for edge in self._inter]
 
     def get_slice_nodes(self, time_slice=0):
     	"""
@@ -260,7 +356,7 @@ class DynamicBayesianNetwork(DirectedGraph):
     	if not isinstance(time_slice, int) or time_slice < 0:
             raise ValueError("The timeslice should be a positive value greater than or equal to zero")
 
-    	return [(node, time_slice) for node in self.nodes()]
+    	return [(node, time_slice) for node in self._names]
 
     def add_cpds(self, *cpds):
         """
@@ -294,14 +390,21 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn.add_cpds(grade_cpd, d_i_cpd, diff_cpd, intel_cpd, i_i_cpd)
         >>> dbn.cpds
         """
+        nodes = self.node
         for cpd in cpds:
             if not isinstance(cpd, (TabularCPD, TreeCPD, RuleCPD)):
                 raise ValueError('cpds should be an instances of TabularCPD, TreeCPD or RuleCPD')
 
-            if set(cpd.variables) - set(cpd.variables).intersection(set(super().nodes())):
+            if any(variable not in nodes for variable in cpd.variables):
                 raise ValueError('CPD defined on variable not in the model', cpd)
 
-            self.cpds.append(cpd)
+            existing = self._cpd_index.get(cpd.variable)
+            if existing is not None:
+                index = next(i for i, c in enumerate(self.cpds) if c is existing)
+                self.cpds[index] = cpd
+            else:
+                self.cpds.append(cpd)
+            self._cpd_index[cpd.variable] = cpd
 
     def get_cpds(self, node=None, time_slice=0):
         """
@@ -331,14 +434,14 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> dbn.get_cpds()
         """
         if node:
-            if node not in super().nodes():
+            if node not in self.node:
                 raise ValueError('Node not present in the model.')
             else:
-                for cpd in self.cpds:
-                    if cpd.variable == node:
-                        return cpd
+                return self._cpd_index.get(node)
         else:
-            return [cpd for cpd in self.cpds if set(list(cpd.variables)).issubset(self.get_slice_nodes(time_slice))]
+            slice_set = frozenset(self.get_slice_nodes(time_slice))
+            return [cpd for cpd in self.cpds
+                    if all(variable in slice_set for variable in cpd.variables)]
 
     def check_model(self):
         """
@@ -353,17 +456,18 @@ class DynamicBayesianNetwork(DirectedGraph):
         check: boolean
         True if all the checks are passed
         """
-        for node in super().nodes():
-            cpd = self.get_cpds(node=node)
+        cpd_by_var = self._cpd_index
+        pred = self.pred
+        for node in self.node:
+            cpd = cpd_by_var.get(node)
             if isinstance(cpd, TabularCPD):
                 evidence = cpd.evidence
-                parents = self.get_parents(node)
+                parents = list(pred[node])
                 if set(evidence if evidence else []) != set(parents if parents else []):
                     raise ValueError("CPD associated with %s doesn't have "
                                      "proper parents associated with it." % node)
-                if not np.allclose(cpd.marginalize(node, inplace=False).values,
-                                   np.ones(np.product(cpd.evidence_card)),
-                                   atol=0.01):
+                if not np.allclose(cpd.values.reshape(cpd.variable_card, -1).sum(axis=0),
+                                   1.0, atol=0.01):
                     raise ValueError('Sum of probabilities of states for node {node}'
                                      ' is not equal to 1'.format(node=node))
         return True
@@ -393,18 +497,20 @@ class DynamicBayesianNetwork(DirectedGraph):
         >>> student.add_cpds(grade_cpd, d_i_cpd, diff_cpd, intel_cpd, i_i_cpd)
         >>> student.initialize_initial_state()
         """
+        have_var = {cpd.variable for cpd in self.cpds}
         for cpd in self.cpds:
             temp_var = (cpd.variable[0], 1 - cpd.variable[1])
-            parents = self.get_parents(temp_var)
-            if not any(x.variable == temp_var for x in self.cpds):
+            if temp_var not in have_var:
+                parents = self.get_parents(temp_var)
                 if all(x[1] == parents[0][1] for x in parents):
                     if parents:
-                        new_cpd = TabularCPD(temp_var, cpd.variable_card, np.split(cpd.values, cpd.variable_card), parents,
+                        new_cpd = TabularCPD(temp_var, cpd.variable_card, cpd.values.reshape(cpd.variable_card, -1), parents,
                            cpd.evidence_card)
                     else:
-                        new_cpd = TabularCPD(temp_var, cpd.variable_card, np.split(cpd.values, cpd.variable_card))
+                        new_cpd = TabularCPD(temp_var, cpd.variable_card, cpd.values.reshape(cpd.variable_card, -1))
                     self.add_cpds(new_cpd)
-            self.check_model()
+                    have_var.add(temp_var)
+        self.check_model()
 
     def moralize(self):
         """
@@ -427,10 +533,14 @@ class DynamicBayesianNetwork(DirectedGraph):
         (('I', 0), ('D', 0)),
         (('G', 1), ('I', 1))]
         """
-        moral_graph = UndirectedGraph(self.to_undirected().edges())
+        cached_graph, cached_version = self._undirected_cache
+        if cached_version != self._version:
+            cached_graph = self.to_undirected()
+            self._undirected_cache = (cached_graph, self._version)
+
+        moral_graph = UndirectedGraph(cached_graph.edges_iter())
 
-        for node in super().nodes():
-            moral_graph.add_edges_from(itertools.combinations(
-                self.get_parents(node), 2))
+        moral_graph.add_edges_from([pair for parents in self.pred.values()
+                                    for pair in itertools.combinations(parents, 2)])
 
         return moral_graph
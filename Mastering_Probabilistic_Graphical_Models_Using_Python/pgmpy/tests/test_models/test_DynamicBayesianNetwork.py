@@ -64,14 +64,14 @@ class TestDynamicBayesianNetworkMethods(unittest.TestCase):
         self.network = DynamicBayesianNetwork()
         self.grade_cpd = TabularCPD(('G', 0), 3, [[0.3, 0.05, 0.9, 0.5],
                                              [0.4, 0.25, 0.08, 0.3],
-                                             [0.3, 0.7, 0.2, 0.2]], [('D', 0), ('I', 0)], [2, 2])
+                                             [0.3, 0.7, 0.02, 0.2]], [('D', 0), ('I', 0)], [2, 2])
         self.d_i_cpd = TabularCPD(('D', 1), 2, [[0.6, 0.3], [0.4, 0.7]], [('D', 0)], 2)
         self.diff_cpd = TabularCPD(('D', 0), 2, [[0.6, 0.4]])
         self.intel_cpd = TabularCPD(('I', 0), 2, [[0.7, 0.3]])
         self.i_i_cpd = TabularCPD(('I', 1), 2, [[0.5, 0.4], [0.5, 0.6]], [('I', 0)], 2)
         self.grade_1_cpd = TabularCPD(('G', 1), 3, [[0.3, 0.05, 0.9, 0.5],
                                              [0.4, 0.25, 0.08, 0.3],
-                                             [0.3, 0.7, 0.2, 0.2]], [('D', 1), ('I', 1)], [2, 2])
+                                             [0.3, 0.7, 0.02, 0.2]], [('D', 1), ('I', 1)], [2, 2])
 
     def test_get_intra_and_inter_edges(self):
         self.network.add_edges_from([(('a', 0), ('b', 0)), (('a', 0), ('a', 1)), (('b', 0), ('b', 1))])